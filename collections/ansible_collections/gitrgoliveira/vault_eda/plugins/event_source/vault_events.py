@@ -19,7 +19,7 @@ description:
     events to ansible-rulebook for processing agentless secret rotation workflows.
   - Supports real-time monitoring of Vault operations including KV secrets,
     database credentials, authentication, and policy changes.
-  - Provides automatic reconnection with exponential backoff for reliable monitoring.
+  - Provides automatic reconnection with jittered exponential backoff for reliable monitoring.
   - "IMPORTANT: Requires Vault Enterprise or HCP Vault Dedicated. Event streaming 
     is not available in Vault Community Edition."
 
@@ -42,7 +42,8 @@ options:
   
   event_paths:
     description:
-      - List of event paths to subscribe to (each creates a separate WebSocket connection).
+      - List of event paths to subscribe to (each creates a separate WebSocket connection
+        unless coalesce_patterns is enabled).
       - "Supported types: 'kv-v1/*', 'kv-v2/*', 'database/*'"
       - "Use wildcards for better performance (e.g., 'kv-v2/*', 'database/*', '*')"
     type: list
@@ -60,6 +61,9 @@ options:
   ping_interval:
     description:
       - WebSocket ping interval in seconds to maintain connection.
+      - Set to 0 or null to disable client pings. TCP keepalive is then enabled on the socket
+        so that a silently dropped connection is still detected and reconnected, although
+        more slowly than with pings.
     type: int
     default: 20
   
@@ -100,10 +104,68 @@ options:
     required: false
     example: 'event_type == "kv-v2/data-write"'
 
+  coalesce_patterns:
+    description:
+      - Subscribe to all event_paths over a single WebSocket connection.
+      - "When enabled and more than one pattern is given, the plugin subscribes to '*' and
+        restricts delivery server-side with 'event_type matches' clauses built from each pattern,
+        combined with filter_expression if set."
+      - "Requires the token to be allowed to subscribe to 'sys/events/subscribe/*'."
+      - Patterns containing characters other than letters, digits, '_', '-', '/' and '*'
+        fall back to one connection per pattern.
+    type: bool
+    default: false
+
+  max_concurrent_connects:
+    description:
+      - Maximum number of WebSocket handshakes performed at the same time.
+      - Limits the burst of TLS handshakes when many patterns reconnect after a Vault outage.
+        Established connections are not limited.
+    type: int
+    default: 4
+
+  on_full:
+    description:
+      - What to do with a new event when the ansible-rulebook event queue is full.
+      - "'block' waits for space in the queue, applying backpressure to the WebSocket connection."
+      - "'drop' discards the new event and logs a warning on the first discarded event
+        and then each time the number of discarded events reaches a power of two."
+      - "'coalesce' discards the new event only if it has the same event type (data.event_type)
+        as the previous event forwarded from the same pattern, otherwise it waits for space.
+        Events without an event type are never discarded."
+      - Only applies when ansible-rulebook uses a bounded queue.
+    type: str
+    choices: ["block", "drop", "coalesce"]
+    default: block
+
+  parse_pool:
+    description:
+      - Decode messages larger than 16 KiB in a pool of worker processes instead of on the
+        event loop.
+      - Only useful on multi-core hosts receiving many large events; for typical Vault events
+        the cost of sending the payload and result between processes exceeds the parsing cost.
+    type: bool
+    default: false
+
+  compression:
+    description:
+      - Negotiate permessage-deflate compression on the WebSocket connection.
+      - Disabled by default, as inflating every frame costs more CPU than it saves for small JSON events.
+    type: bool
+    default: false
+
+  max_size:
+    description:
+      - Maximum size in bytes of an incoming event message. Larger messages close the connection.
+      - Set to 0 or null to disable the limit.
+    type: int
+    default: 1048576
+
 requirements:
   - python >= 3.12
-  - websockets >= 10.0
+  - websockets >= 14.0
   - asyncio
+  - orjson (optional, used for faster JSON decoding when installed)
   - HashiCorp Vault Enterprise 1.13+ or HCP Vault Dedicated with event streaming enabled
   - Proper Vault ACL policies for event subscription and secret access
 
@@ -112,11 +174,12 @@ author:
 
 notes:
   - Requires Vault Enterprise 1.13+ or HCP Vault Dedicated (not available in Community Edition).
-  - Automatic WebSocket reconnection with exponential backoff.
-  - Each event pattern creates a separate WebSocket connection.
+  - Automatic WebSocket reconnection with jittered exponential backoff.
+  - Each event pattern creates a separate WebSocket connection unless coalesce_patterns is enabled.
   - Environment variables supported with ansible-rulebook --env-vars flag.
   - Requires proper ACL policies for event subscription and secret access.
   - Event notifications follow CloudEvents specification format.
+  - Runs on the asyncio event loop owned by ansible-rulebook; the plugin does not install an alternative loop such as uvloop.
 
 seealso:
   - name: HashiCorp Vault Event Streaming
@@ -147,7 +210,7 @@ EXAMPLES = """
           - "database/*"
 
 
-# Multiple patterns (creates separate connections)
+# Multiple patterns (creates separate connections unless coalesce_patterns is enabled)
 - name: Monitor multiple event types
   sources:
     - gitrgoliveira.vault_eda.vault_events:
@@ -208,33 +271,270 @@ Vault operations including KV secrets, authentication, and policy changes.
 
 Author: Ricardo Oliveira
 License: Mozilla Public License 2.0 (MPL-2.0)
-Dependencies: websockets, asyncio
+Dependencies: websockets, asyncio (orjson optional)
 """
 
 import asyncio
+import contextlib
 import json
 import logging
+import multiprocessing
+import random
+import re
+import socket
 import ssl
-from typing import Any, Dict, List, Optional
+from concurrent.futures import BrokenExecutor, Executor, ProcessPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, TypedDict, Union
 from urllib.parse import quote
 
 from websockets import connect
-from websockets.exceptions import ConnectionClosed, WebSocketException
+from websockets.exceptions import ConnectionClosed, ConnectionClosedOK, WebSocketException
+
+# Prefer orjson for decoding event payloads; fall back to the standard library.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so error handling is shared.
+_json_loads: Callable[[Union[bytes, str]], Any]
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - exercised only without orjson installed
+    _json_loads = json.loads
 
 # Configure logging for the plugin
 log = logging.getLogger("vault_events")
 
+# Supported policies for handling a full event queue
+_ON_FULL_POLICIES = ("block", "drop", "coalesce")
+
+# Messages larger than this are decoded in the parse pool when it is enabled
+_PARSE_POOL_THRESHOLD = 16384
+
+# Number of payload bytes kept in the raw field of parse-failure events
+_RAW_PREVIEW_BYTES = 256
+
+# Event patterns that can be safely translated into a go-bexpr regex clause
+_COALESCABLE_PATTERN = re.compile(r"[A-Za-z0-9_/*-]+")
+
+# TCP keepalive idle time, probe interval (seconds) and probe count used when pings are disabled
+_TCP_KEEPALIVE_OPTIONS = (("TCP_KEEPIDLE", 30), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3))
+
+
+class ErrorEvent(TypedDict):
+    """Event forwarded to ansible-rulebook when a message cannot be parsed."""
+
+    raw: str
+    raw_size: int
+    error: str
+    pattern: str
+
+
+async def _iter_raw_messages(ws) -> AsyncIterator[bytes]:
+    """
+    Yield raw message payloads from a WebSocket connection.
+
+    Text frames are returned as undecoded UTF-8 bytes so they can be passed straight
+    to the JSON parser without an intermediate copy. Like iterating the connection
+    directly, this stops when the connection is closed normally.
+
+    Args:
+        ws: Open WebSocket client connection
+
+    Yields:
+        Message payload as bytes
+    """
+    try:
+        while True:
+            # recv() reassembles fragmented messages into a single bytes object;
+            # recv_streaming() would only add per-fragment objects and a join
+            yield await ws.recv(decode=False)
+    except ConnectionClosedOK:
+        return
+
+
+def _enable_tcp_keepalive(ws) -> None:
+    """
+    Enable TCP keepalive on the socket underlying a WebSocket connection.
+
+    Used when WebSocket pings are disabled, so that a connection dropped without a
+    FIN or RST (for example by a load balancer) still fails instead of leaving recv()
+    waiting forever. Tuning options missing on the platform are skipped.
+
+    Args:
+        ws: Open WebSocket client connection
+    """
+    sock = ws.transport.get_extra_info("socket")
+    if sock is None:
+        return
+
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    for option, value in _TCP_KEEPALIVE_OPTIONS:
+        if hasattr(socket, option):
+            sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, option), value)
+
+
+def _event_type(event: Any) -> Optional[str]:
+    """
+    Return the Vault event type of a decoded event.
+
+    Vault CloudEvents carry the type at data.event_type; a top-level event_type
+    is used as a fallback.
+
+    Args:
+        event: Decoded event, which may be any JSON value
+
+    Returns:
+        Event type, or None if the event is not an object or does not carry one
+    """
+    if not isinstance(event, dict):
+        return None
+
+    data = event.get("data")
+    if isinstance(data, dict) and data.get("event_type") is not None:
+        return data["event_type"]
+    return event.get("event_type")
+
+
+def _error_event(msg: bytes, error: str, event_pattern: str) -> ErrorEvent:
+    """
+    Build the event forwarded in place of a message that could not be parsed.
+
+    Only the first bytes of the payload are kept so that oversized malformed messages
+    are not retained by the event queue; the full size is reported in raw_size.
+
+    Args:
+        msg: Raw message payload received from Vault
+        error: Short description of the parsing failure
+        event_pattern: Event pattern the message was received for
+
+    Returns:
+        Error event dictionary
+    """
+    return {
+        "raw": msg[:_RAW_PREVIEW_BYTES].decode("utf-8", "replace"),
+        "raw_size": len(msg),
+        "error": error,
+        "pattern": event_pattern,
+    }
+
+
+def _log_received_event(event: Any, event_pattern: str) -> None:
+    """
+    Log a decoded event at debug level.
+
+    Args:
+        event: Decoded event
+        event_pattern: Event pattern the message was received for
+    """
+    event_type = _event_type(event)
+    log.debug(
+        "Received Vault event from pattern '%s': %s",
+        event_pattern,
+        event_type if event_type is not None else "unknown",
+    )
+
+
+def _decode_event(msg: bytes, event_pattern: str, debug_enabled: bool) -> Union[Dict[str, Any], ErrorEvent]:
+    """
+    Decode a single raw WebSocket message into an event for ansible-rulebook.
+
+    Malformed messages are not raised; they are turned into an error event that
+    carries the raw payload and the originating pattern.
+
+    Args:
+        msg: Raw message payload received from Vault
+        event_pattern: Event pattern the message was received for
+        debug_enabled: Whether debug logging is enabled for the plugin logger
+
+    Returns:
+        Decoded event dictionary, or an error event if the payload cannot be parsed
+    """
+    try:
+        # Parse JSON event data from Vault
+        event = _json_loads(msg)
+        # Skip the event_type lookup entirely unless debug logging is on
+        if debug_enabled:
+            _log_received_event(event, event_pattern)
+    except json.JSONDecodeError as e:
+        # Handle malformed JSON gracefully
+        log.warning(
+            "Failed to parse JSON message from pattern '%s': %s",
+            event_pattern,
+            e,
+        )
+        event = _error_event(msg, "json_decode_failed", event_pattern)
+    except (UnicodeDecodeError, ValueError, TypeError) as e:
+        # Handle any other parsing errors
+        log.error(
+            "Unexpected error parsing message from pattern '%s': %s",
+            event_pattern,
+            e,
+        )
+        event = _error_event(msg, str(e), event_pattern)
+
+    return event
+
+
+def _create_parse_pool() -> ProcessPoolExecutor:
+    """
+    Create the worker process pool used to decode large messages.
+
+    Workers are started through a fork server rather than by forking the
+    ansible-rulebook process, which is multi-threaded (it embeds a JVM) and
+    cannot be forked safely.
+
+    Returns:
+        Process pool executor; worker processes are started on first use
+    """
+    return ProcessPoolExecutor(mp_context=multiprocessing.get_context("forkserver"))
+
+
+async def _decode_event_in_executor(
+    executor: Executor, msg: bytes, event_pattern: str, debug_enabled: bool
+) -> Union[Dict[str, Any], ErrorEvent]:
+    """
+    Decode a raw WebSocket message in an executor instead of on the event loop.
+
+    Only the JSON parser itself is sent to the executor, as the plugin module cannot
+    be imported by worker processes. Messages that fail to parse are decoded again
+    locally so they produce the same error event as _decode_event.
+
+    Args:
+        executor: Executor used for parsing, typically a process pool
+        msg: Raw message payload received from Vault
+        event_pattern: Event pattern the message was received for
+        debug_enabled: Whether debug logging is enabled for the plugin logger
+
+    Returns:
+        Decoded event dictionary, or an error event if the payload cannot be parsed
+
+    Raises:
+        BrokenExecutor: If the executor can no longer run tasks
+    """
+    try:
+        event = await asyncio.get_running_loop().run_in_executor(executor, _json_loads, msg)
+    except (ValueError, TypeError):
+        return _decode_event(msg, event_pattern, debug_enabled)
+
+    if debug_enabled:
+        _log_received_event(event, event_pattern)
+    return event
+
 
 async def _stream_single_pattern(  # pylint: disable=too-many-arguments,too-many-positional-arguments
     queue,
     vault_addr: str,
     event_pattern: str,
     headers: Dict[str, str],
-    ping_interval: int,
-    verify_ssl: bool,
+    ping_interval: Optional[int],
+    ssl_context: Optional[ssl.SSLContext],
     backoff_initial: float,
     backoff_max: float,
-    filter_expression: Optional[str] = None,
+    encoded_filter: Optional[str] = None,
+    connect_semaphore: Optional[asyncio.Semaphore] = None,
+    on_full: str = "block",
+    parse_executor: Optional[Executor] = None,
+    compression: bool = False,
+    max_size: Optional[int] = 2**20,
 ):
     """
     Establish and maintain WebSocket connection to Vault events endpoint for a single pattern.
@@ -244,36 +544,53 @@ async def _stream_single_pattern(  # pylint: disable=too-many-arguments,too-many
         vault_addr: Base Vault server URL
         event_pattern: Single event pattern to subscribe to
         headers: HTTP headers including authentication
-        ping_interval: Seconds between WebSocket ping frames
-        verify_ssl: Whether to verify SSL certificates
+        ping_interval: Seconds between WebSocket ping frames, None to disable pings and use TCP keepalive
+        ssl_context: Shared SSL context for wss:// connections, None for plain ws://
         backoff_initial: Initial reconnection delay in seconds
         backoff_max: Maximum reconnection delay in seconds
-        filter_expression: Optional go-bexpr boolean expression to filter events
+        encoded_filter: Optional URL-encoded go-bexpr boolean expression to filter events
+        connect_semaphore: Optional semaphore shared across patterns to limit concurrent handshakes
+        on_full: Policy when the queue is full - "block", "drop" or "coalesce"
+        parse_executor: Optional executor used to decode messages larger than _PARSE_POOL_THRESHOLD
+        compression: Whether to negotiate permessage-deflate compression
+        max_size: Maximum incoming message size in bytes, None for no limit
     """
     # Build the WebSocket URL for this specific pattern
-    url = _build_event_url(vault_addr, event_pattern, filter_expression)
-
-    # Configure SSL context for secure connections
-    ssl_ctx = None
-    if url.startswith("wss://"):
-        ssl_ctx = ssl.create_default_context()
-        if not verify_ssl:
-            # Disable SSL verification for development environments
-            ssl_ctx.check_hostname = False
-            ssl_ctx.verify_mode = ssl.CERT_NONE
-
-    # Exponential backoff for reconnection attempts
+    url = _build_event_url(vault_addr, event_pattern, encoded_filter)
+
+    # Exponential backoff for reconnection attempts, randomised per task so that
+    # connections dropped together do not all retry at the same moment
     backoff = backoff_initial
+    rng = random.Random()
+
+    # Only the opening handshake is limited, not the lifetime of the connection
+    handshake_limit = connect_semaphore if connect_semaphore is not None else contextlib.nullcontext()
+
+    # Resolve the log level once instead of on every received message
+    debug_enabled = log.isEnabledFor(logging.DEBUG)
+
+    # Queue-full bookkeeping for the drop and coalesce policies
+    dropped = 0
+    last_event_type = None
 
     while True:
         try:
             # Establish WebSocket connection with proper headers
-            async with connect(
-                url,
-                additional_headers=headers,
-                ping_interval=ping_interval,
-                ssl=ssl_ctx,
-            ) as ws:
+            async with handshake_limit:
+                ws = await connect(
+                    url,
+                    additional_headers=headers,
+                    ping_interval=ping_interval,
+                    ssl=ssl_context,
+                    compression="deflate" if compression else None,
+                    max_size=max_size,
+                )
+
+            async with ws:
+                if ping_interval is None:
+                    # Without pings, only TCP keepalive can detect a half-open connection
+                    _enable_tcp_keepalive(ws)
+
                 log.info(
                     "Connected to Vault WebSocket for pattern '%s': %s",
                     event_pattern,
@@ -281,39 +598,46 @@ async def _stream_single_pattern(  # pylint: disable=too-many-arguments,too-many
                 )
                 backoff = backoff_initial  # Reset backoff on successful connection
 
-                # Process incoming messages from Vault
-                async for msg in ws:
-                    try:
-                        # Parse JSON event data from Vault
-                        event = json.loads(msg)
-                        log.debug(
-                            "Received Vault event from pattern '%s': %s",
-                            event_pattern,
-                            event.get("event_type", "unknown"),
-                        )
-                    except json.JSONDecodeError as e:
-                        # Handle malformed JSON gracefully
-                        log.warning(
-                            "Failed to parse JSON message from pattern '%s': %s",
-                            event_pattern,
-                            e,
-                        )
-                        event = {
-                            "raw": msg,
-                            "error": "json_decode_failed",
-                            "pattern": event_pattern,
-                        }
-                    except (UnicodeDecodeError, ValueError, TypeError) as e:
-                        # Handle any other parsing errors
-                        log.error(
-                            "Unexpected error parsing message from pattern '%s': %s",
-                            event_pattern,
-                            e,
-                        )
-                        event = {"raw": msg, "error": str(e), "pattern": event_pattern}
-
-                    # Forward event to ansible-rulebook queue
-                    await queue.put(event)
+                # Process incoming messages from Vault as raw bytes
+                async for msg in _iter_raw_messages(ws):
+                    if parse_executor is not None and len(msg) > _PARSE_POOL_THRESHOLD:
+                        try:
+                            event = await _decode_event_in_executor(parse_executor, msg, event_pattern, debug_enabled)
+                        except BrokenExecutor as e:
+                            # A dead worker must not stop the stream; decode locally from now on
+                            log.warning(
+                                "Parse pool is broken, decoding messages from pattern '%s' on the event loop: %s",
+                                event_pattern,
+                                e,
+                            )
+                            parse_executor = None
+                            event = _decode_event(msg, event_pattern, debug_enabled)
+                    else:
+                        event = _decode_event(msg, event_pattern, debug_enabled)
+
+                    event_type = _event_type(event) if on_full == "coalesce" else None
+
+                    # Forward event to ansible-rulebook queue, only awaiting when it is full
+                    if not queue.full():
+                        queue.put_nowait(event)
+                    elif on_full == "block":
+                        await queue.put(event)
+                    elif on_full == "coalesce" and (event_type is None or event_type != last_event_type):
+                        # Only repeats of the previous known event type are coalesced away
+                        await queue.put(event)
+                    else:
+                        dropped += 1
+                        # Log at powers of two so a sustained overload does not flood the log
+                        if dropped & (dropped - 1) == 0:
+                            log.warning(
+                                "Event queue full, dropped event from pattern '%s' (%d dropped so far)",
+                                event_pattern,
+                                dropped,
+                            )
+                        continue
+
+                    if on_full == "coalesce":
+                        last_event_type = event_type
 
         except asyncio.CancelledError:
             # Handle graceful shutdown
@@ -323,7 +647,10 @@ async def _stream_single_pattern(  # pylint: disable=too-many-arguments,too-many
             )
             raise
         except (ConnectionClosed, WebSocketException, OSError, ssl.SSLError) as e:
-            # Handle connection errors with exponential backoff
+            # Handle connection errors with exponential backoff. Decorrelated jitter: draw
+            # the delay before sleeping, up to 3x the previous delay and capped at backoff_max,
+            # so even the first retry after a shared outage is spread across tasks
+            backoff = min(backoff_max, rng.uniform(backoff_initial, backoff * 3))
             log.warning(
                 "WebSocket for pattern '%s' disconnected: %s; reconnecting in %.1fs",
                 event_pattern,
@@ -331,7 +658,6 @@ async def _stream_single_pattern(  # pylint: disable=too-many-arguments,too-many
                 backoff,
             )
             await asyncio.sleep(backoff)
-            backoff = min(backoff * 2, backoff_max)  # Exponential backoff with cap
 
 
 async def _stream_multiple_patterns(  # pylint: disable=too-many-arguments,too-many-positional-arguments
@@ -339,11 +665,16 @@ async def _stream_multiple_patterns(  # pylint: disable=too-many-arguments,too-m
     vault_addr: str,
     event_paths: List[str],
     headers: Dict[str, str],
-    ping_interval: int,
-    verify_ssl: bool,
+    ping_interval: Optional[int],
+    ssl_context: Optional[ssl.SSLContext],
     backoff_initial: float,
     backoff_max: float,
-    filter_expression: Optional[str] = None,
+    encoded_filter: Optional[str] = None,
+    connect_semaphore: Optional[asyncio.Semaphore] = None,
+    on_full: str = "block",
+    parse_executor: Optional[Executor] = None,
+    compression: bool = False,
+    max_size: Optional[int] = 2**20,
 ):
     """
     Manage multiple WebSocket connections for different event patterns.
@@ -353,52 +684,132 @@ async def _stream_multiple_patterns(  # pylint: disable=too-many-arguments,too-m
         vault_addr: Base Vault server URL
         event_paths: List of event patterns to subscribe to
         headers: HTTP headers including authentication
-        ping_interval: Seconds between WebSocket ping frames
-        verify_ssl: Whether to verify SSL certificates
+        ping_interval: Seconds between WebSocket ping frames, None to disable pings
+        ssl_context: Shared SSL context for wss:// connections, None for plain ws://
         backoff_initial: Initial reconnection delay in seconds
         backoff_max: Maximum reconnection delay in seconds
-        filter_expression: Optional go-bexpr boolean expression to filter events
+        encoded_filter: Optional URL-encoded go-bexpr boolean expression to filter events
+        connect_semaphore: Optional semaphore shared across patterns to limit concurrent handshakes
+        on_full: Policy when the queue is full - "block", "drop" or "coalesce"
+        parse_executor: Optional executor used to decode messages larger than _PARSE_POOL_THRESHOLD
+        compression: Whether to negotiate permessage-deflate compression
+        max_size: Maximum incoming message size in bytes, None for no limit
     """
-    # Create tasks for each event pattern
-    tasks = []
+    # Create a stream for each event pattern
+    streams = []
     for pattern in event_paths:
         log.info("Creating WebSocket connection for event pattern: %s", pattern)
-        task = asyncio.create_task(
+        streams.append(
             _stream_single_pattern(
                 queue,
                 vault_addr,
                 pattern,
                 headers,
                 ping_interval,
-                verify_ssl,
+                ssl_context,
                 backoff_initial,
                 backoff_max,
-                filter_expression,
+                encoded_filter,
+                connect_semaphore,
+                on_full,
+                parse_executor,
+                compression,
+                max_size,
             )
         )
-        tasks.append(task)
 
     try:
-        # Wait for all tasks to complete (they run indefinitely)
-        await asyncio.gather(*tasks)
+        # The task group cancels every stream if one fails or the group is cancelled
+        async with asyncio.TaskGroup() as task_group:
+            for stream in streams:
+                task_group.create_task(stream)
     except asyncio.CancelledError:
-        # Cancel all tasks when shutting down
         log.info("Cancelling all WebSocket connections")
-        for task in tasks:
-            task.cancel()
-        # Wait for all tasks to finish cancellation
-        await asyncio.gather(*tasks, return_exceptions=True)
         raise
 
 
-def _build_event_url(vault_addr: str, event_pattern: str, filter_expression: Optional[str] = None) -> str:
+def _build_ssl_context(vault_addr: str, verify_ssl: bool) -> Optional[ssl.SSLContext]:
+    """
+    Create the SSL context shared by all WebSocket connections.
+
+    The context is built once so reconnects do not reload the system trust store.
+
+    Args:
+        vault_addr: Base Vault server URL (http/https)
+        verify_ssl: Whether to verify SSL certificates
+
+    Returns:
+        SSL context for HTTPS Vault addresses, None for plain HTTP
+    """
+    if not vault_addr.startswith("https://"):
+        return None
+
+    ssl_ctx = ssl.create_default_context()
+    if not verify_ssl:
+        # Disable SSL verification for development environments
+        ssl_ctx.check_hostname = False
+        ssl_ctx.verify_mode = ssl.CERT_NONE
+    return ssl_ctx
+
+
+def _coalesce_patterns(
+    event_paths: List[str], filter_expression: Optional[str] = None
+) -> Optional[Tuple[str, Optional[str]]]:
+    """
+    Combine multiple event patterns into a single subscription.
+
+    Vault only accepts one pattern per WebSocket connection, so the patterns are
+    expressed as a server-side filter on a '*' subscription instead. Each glob
+    pattern becomes an anchored 'event_type matches' clause and the clauses are
+    OR-joined, then AND-ed with the user supplied filter expression.
+
+    Args:
+        event_paths: List of event patterns to subscribe to
+        filter_expression: Optional go-bexpr boolean expression to filter events
+
+    Returns:
+        Tuple of (event pattern, filter expression) for a single connection, or None
+        if the patterns cannot be coalesced
+    """
+    if len(event_paths) < 2:
+        return None
+
+    # A catch-all pattern already covers every other pattern
+    if "*" in event_paths:
+        return "*", filter_expression
+
+    if not all(_COALESCABLE_PATTERN.fullmatch(pattern) for pattern in event_paths):
+        return None
+
+    clauses = " or ".join(
+        f'event_type matches "^{pattern.replace("*", ".*")}$"' for pattern in event_paths
+    )
+    if filter_expression:
+        return "*", f"({filter_expression}) and ({clauses})"
+    return "*", clauses
+
+
+def _encode_filter(filter_expression: Optional[str]) -> Optional[str]:
+    """
+    URL-encode a filter expression for the event subscription query string.
+
+    Args:
+        filter_expression: Optional go-bexpr boolean expression to filter events
+
+    Returns:
+        Encoded filter expression, or None if no filter is set
+    """
+    return quote(filter_expression) if filter_expression else None
+
+
+def _build_event_url(vault_addr: str, event_pattern: str, encoded_filter: Optional[str] = None) -> str:
     """
     Construct the WebSocket URL for Vault event subscription.
 
     Args:
         vault_addr: Base Vault server URL (http/https)
         event_pattern: Single event pattern to subscribe to
-        filter_expression: Optional go-bexpr boolean expression to filter events
+        encoded_filter: Optional go-bexpr boolean expression, already URL-encoded
 
     Returns:
         Complete WebSocket URL for event subscription
@@ -413,10 +824,8 @@ def _build_event_url(vault_addr: str, event_pattern: str, filter_expression: Opt
     event_url = f"{ws_url}/v1/sys/events/subscribe/{event_pattern}?json=true"
     
     # Add filter expression if provided
-    if filter_expression:
-        encoded_filter = quote(filter_expression)
+    if encoded_filter:
         event_url += f"&filter={encoded_filter}"
-        log.info("Applied filter expression: %s", filter_expression)
     
     log.info("Built event URL: %s", event_url)
 
@@ -437,18 +846,26 @@ async def main(queue: Any, args: Dict[str, Any]):
     Expected args:
         vault_addr: Vault server URL (e.g., "http://127.0.0.1:8200")
         vault_token: Vault authentication token
-        event_paths: List of event patterns to subscribe to (separate connection per pattern)
+        event_paths: List of event patterns to subscribe to (separate connection per pattern
+            unless coalesce_patterns is enabled)
         verify_ssl: Whether to verify SSL certificates (default: True)
-        ping_interval: WebSocket ping interval in seconds (default: 20)
+        ping_interval: WebSocket ping interval in seconds, 0 or None to disable (default: 20)
         backoff_initial: Initial reconnection delay (default: 1.0)
         backoff_max: Maximum reconnection delay (default: 30.0)
         namespace: Optional Vault namespace
         headers: Optional additional HTTP headers
         filter_expression: Optional go-bexpr boolean expression to filter events
+        coalesce_patterns: Whether to share one connection across event_paths (default: False)
+        max_concurrent_connects: Maximum simultaneous WebSocket handshakes (default: 4)
+        on_full: Policy when the event queue is full - block, drop or coalesce (default: block)
+        parse_pool: Whether to decode large messages in worker processes (default: False)
+        compression: Whether to negotiate permessage-deflate compression (default: False)
+        max_size: Maximum incoming message size in bytes, 0 or None for no limit (default: 1048576)
 
     Note:
-        Each event pattern in event_paths will get its own WebSocket connection.
-        For best performance, use patterns with wildcards (e.g., "kv-v2/*").
+        Each event pattern in event_paths will get its own WebSocket connection unless
+        coalesce_patterns is enabled. For best performance, use patterns with wildcards
+        (e.g., "kv-v2/*").
     """
     log.info("Starting Vault WebSocket event source plugin")
 
@@ -465,19 +882,19 @@ async def main(queue: Any, args: Dict[str, Any]):
     if isinstance(event_paths, str):
         event_paths = [event_paths]  # Convert single string to list
 
+    # Drop duplicate patterns, keeping the first occurrence, to avoid redundant connections
+    unique_event_paths = list(dict.fromkeys(event_paths))
+    if len(unique_event_paths) != len(event_paths):
+        log.warning(
+            "Ignoring %d duplicate event path(s); subscribing to: %s",
+            len(event_paths) - len(unique_event_paths),
+            unique_event_paths,
+        )
+        event_paths = unique_event_paths
+
     log.info("Vault Address: %s", vault_addr)
     log.info("Event Paths: %s", event_paths)
 
-    # Inform about multiple connections
-    if len(event_paths) > 1:
-        log.info(
-            "Multiple event paths provided. Creating %d separate WebSocket connections.",
-            len(event_paths),
-        )
-        log.info(
-            "For optimal performance, consider using single patterns with wildcards (e.g., 'kv-v2/*', 'database/*', '*')."
-        )
-
     # Prepare HTTP headers for authentication
     headers: Dict[str, str] = {}
     headers["X-Vault-Token"] = vault_token
@@ -495,29 +912,106 @@ async def main(queue: Any, args: Dict[str, Any]):
 
     # Extract connection parameters with defaults
     verify_ssl = bool(args.get("verify_ssl", True))
-    ping_interval = int(args.get("ping_interval", 20))
+    ping_interval_arg = args.get("ping_interval", 20)
+    ping_interval = int(ping_interval_arg) if ping_interval_arg else None  # 0 or None disables pings
     backoff_initial = float(args.get("backoff_initial", 1.0))
     backoff_max = float(args.get("backoff_max", 30.0))
     filter_expression = args.get("filter_expression")
+    coalesce_patterns = bool(args.get("coalesce_patterns", False))
+    max_concurrent_connects = int(args.get("max_concurrent_connects", 4))
+    if max_concurrent_connects < 1:
+        raise ValueError("max_concurrent_connects must be at least 1")
+    on_full = args.get("on_full", "block")
+    if on_full not in _ON_FULL_POLICIES:
+        raise ValueError(f"on_full must be one of: {', '.join(_ON_FULL_POLICIES)}")
+    parse_pool = bool(args.get("parse_pool", False))
+    compression = bool(args.get("compression", False))
+    max_size_arg = args.get("max_size", 2**20)
+    max_size = int(max_size_arg) if max_size_arg else None  # 0 or None disables the limit
+    if max_size is not None and max_size < 0:
+        raise ValueError("max_size must not be negative")
 
     log.info(
-        "Connection settings - SSL verify: %s, Ping interval: %ds",
+        "Connection settings - SSL verify: %s, Ping interval: %s",
         verify_ssl,
-        ping_interval,
+        f"{ping_interval}s" if ping_interval else "disabled",
     )
     
     if filter_expression:
         log.info("Using filter expression: %s", filter_expression)
 
-    # Start the WebSocket streams - create separate connections for multiple patterns
-    await _stream_multiple_patterns(
-        queue=queue,
-        vault_addr=vault_addr,
-        event_paths=event_paths,
-        headers=headers,
-        ping_interval=ping_interval,
-        verify_ssl=verify_ssl,
-        backoff_initial=backoff_initial,
-        backoff_max=backoff_max,
-        filter_expression=filter_expression,
-    )
+    ssl_context = _build_ssl_context(vault_addr, verify_ssl)
+    connect_semaphore = asyncio.Semaphore(max_concurrent_connects)
+
+    # Worker processes for large messages; the pool only starts processes on first use
+    parse_executor = _create_parse_pool() if parse_pool else None
+    if parse_executor is not None:
+        log.info("Decoding messages larger than %d bytes in a process pool", _PARSE_POOL_THRESHOLD)
+
+    try:
+        # Share a single connection across patterns when requested and possible
+        coalesced = None
+        if coalesce_patterns and len(event_paths) > 1:
+            coalesced = _coalesce_patterns(event_paths, filter_expression)
+            if coalesced is None:
+                log.warning(
+                    "Event paths %s cannot be coalesced into a single connection; using one connection per pattern",
+                    event_paths,
+                )
+
+        if coalesced is not None:
+            coalesced_pattern, coalesced_filter = coalesced
+            log.info(
+                "Coalesced %d event paths into a single WebSocket connection for pattern '%s'",
+                len(event_paths),
+                coalesced_pattern,
+            )
+            log.info("Using coalesced filter expression: %s", coalesced_filter)
+            await _stream_single_pattern(
+                queue=queue,
+                vault_addr=vault_addr,
+                event_pattern=coalesced_pattern,
+                headers=headers,
+                ping_interval=ping_interval,
+                ssl_context=ssl_context,
+                backoff_initial=backoff_initial,
+                backoff_max=backoff_max,
+                encoded_filter=_encode_filter(coalesced_filter),
+                connect_semaphore=connect_semaphore,
+                on_full=on_full,
+                parse_executor=parse_executor,
+                compression=compression,
+                max_size=max_size,
+            )
+            return
+
+        # Inform about multiple connections
+        if len(event_paths) > 1:
+            log.info(
+                "Multiple event paths provided. Creating %d separate WebSocket connections.",
+                len(event_paths),
+            )
+            log.info(
+                "For optimal performance, consider using single patterns with wildcards (e.g., 'kv-v2/*', 'database/*', '*')."
+            )
+
+        # Start the WebSocket streams - create separate connections for multiple patterns
+        await _stream_multiple_patterns(
+            queue=queue,
+            vault_addr=vault_addr,
+            event_paths=event_paths,
+            headers=headers,
+            ping_interval=ping_interval,
+            ssl_context=ssl_context,
+            backoff_initial=backoff_initial,
+            backoff_max=backoff_max,
+            encoded_filter=_encode_filter(filter_expression),
+            connect_semaphore=connect_semaphore,
+            on_full=on_full,
+            parse_executor=parse_executor,
+            compression=compression,
+            max_size=max_size,
+        )
+    finally:
+        if parse_executor is not None:
+            parse_executor.shutdown(wait=False, cancel_futures=True)
@@ -2,7 +2,8 @@
 
 import asyncio
 import json
-from urllib.parse import parse_qs, urlparse
+import socket
+from urllib.parse import parse_qs, quote, urlparse
 
 import pytest
 from unittest.mock import AsyncMock
@@ -12,33 +13,39 @@ class _FakeWebSocket:
     def __init__(self, messages):
         self._messages = list(messages)
 
-    def __aiter__(self):
-        return self._iter_messages()
+    async def recv(self, decode=None):
+        if not self._messages:
+            raise asyncio.CancelledError()
+        message = self._messages.pop(0)
+        if decode is False and isinstance(message, str):
+            return message.encode("utf-8")
+        return message
 
-    async def _iter_messages(self):
-        for message in self._messages:
-            yield message
-        raise asyncio.CancelledError()
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
 
 
-class _ConnectContextManager:
+class _PendingConnection:
     def __init__(self, websocket):
         self._websocket = websocket
 
-    async def __aenter__(self):
+    def __await__(self):
+        return self._open().__await__()
+
+    async def _open(self):
         return self._websocket
 
-    async def __aexit__(self, exc_type, exc, tb):
-        return False
 
+class _FailingConnection:
+    def __await__(self):
+        return self._open().__await__()
 
-class _FailingConnectContextManager:
-    async def __aenter__(self):
+    async def _open(self):
         raise OSError("connection dropped")
 
-    async def __aexit__(self, exc_type, exc, tb):
-        return False
-
 
 def test_build_event_url_without_filter(vault_events_module):
     url = vault_events_module._build_event_url(
@@ -53,7 +60,7 @@ def test_build_event_url_with_filter(vault_events_module):
     url = vault_events_module._build_event_url(
         "https://vault.example.com:8200",
         "kv-v2/*",
-        'event_type == "kv-v2/data-write"',
+        vault_events_module._encode_filter('event_type == "kv-v2/data-write"'),
     )
 
     parsed = urlparse(url)
@@ -66,6 +73,41 @@ def test_build_event_url_with_filter(vault_events_module):
     assert query["filter"] == ['event_type == "kv-v2/data-write"']
 
 
+def test_encode_filter(vault_events_module):
+    assert vault_events_module._encode_filter(None) is None
+    assert vault_events_module._encode_filter('event_type == "kv-v2/data-write"') == (
+        "event_type%20%3D%3D%20%22kv-v2/data-write%22"
+    )
+
+
+def test_decode_event_parses_json_bytes(vault_events_module):
+    event = vault_events_module._decode_event(b'{"event_type": "kv-v2/data-write"}', "kv-v2/*", False)
+
+    assert event == {"event_type": "kv-v2/data-write"}
+
+
+def test_decode_event_returns_error_event_for_invalid_utf8(vault_events_module):
+    event = vault_events_module._decode_event(b"\xff\xfe", "kv-v2/*", False)
+
+    assert event["raw"] == "\ufffd\ufffd"
+    assert event["pattern"] == "kv-v2/*"
+    assert "error" in event
+
+
+def test_error_event_is_plain_dict(vault_events_module):
+    event = vault_events_module._error_event(b"not-json", "json_decode_failed", "kv-v2/*")
+
+    assert type(event) is dict
+    assert event == {"raw": "not-json", "raw_size": 8, "error": "json_decode_failed", "pattern": "kv-v2/*"}
+
+
+def test_error_event_truncates_large_payloads(vault_events_module):
+    event = vault_events_module._error_event(b"x" * 10000, "json_decode_failed", "kv-v2/*")
+
+    assert event["raw"] == "x" * 256
+    assert event["raw_size"] == 10000
+
+
 @pytest.mark.asyncio
 async def test_main_requires_vault_addr(vault_events_module):
     with pytest.raises(ValueError, match="vault_addr parameter is required"):
@@ -110,11 +152,29 @@ async def test_main_normalizes_event_paths_and_headers(monkeypatch, vault_events
     assert call["headers"]["X-Vault-Token"] == "my-token"
     assert call["headers"]["X-Vault-Namespace"] == "admin"
     assert call["headers"]["X-Custom"] == "value"
-    assert call["verify_ssl"] is False
+    assert call["ssl_context"] is None
     assert call["ping_interval"] == 30
     assert call["backoff_initial"] == 0.5
     assert call["backoff_max"] == 5.0
-    assert call["filter_expression"] == 'event_type contains "write"'
+    assert call["encoded_filter"] == quote('event_type contains "write"')
+
+
+@pytest.mark.asyncio
+async def test_main_deduplicates_event_paths(monkeypatch, caplog, vault_events_module):
+    stream_mock = AsyncMock()
+    monkeypatch.setattr(vault_events_module, "_stream_multiple_patterns", stream_mock)
+
+    await vault_events_module.main(
+        asyncio.Queue(),
+        {
+            "vault_addr": "http://127.0.0.1:8200",
+            "vault_token": "my-token",
+            "event_paths": ["kv-v2/*", "database/*", "kv-v2/*"],
+        },
+    )
+
+    assert stream_mock.await_args.kwargs["event_paths"] == ["kv-v2/*", "database/*"]
+    assert "Ignoring 1 duplicate event path(s)" in caplog.text
 
 
 @pytest.mark.asyncio
@@ -125,7 +185,7 @@ async def test_stream_single_pattern_queues_valid_json_event(monkeypatch, vault_
     monkeypatch.setattr(
         vault_events_module,
         "connect",
-        lambda *args, **kwargs: _ConnectContextManager(websocket),
+        lambda *args, **kwargs: _PendingConnection(websocket),
     )
 
     with pytest.raises(asyncio.CancelledError):
@@ -135,7 +195,7 @@ async def test_stream_single_pattern_queues_valid_json_event(monkeypatch, vault_
             event_pattern="kv-v2/*",
             headers={"X-Vault-Token": "token"},
             ping_interval=20,
-            verify_ssl=True,
+            ssl_context=None,
             backoff_initial=1.0,
             backoff_max=30.0,
         )
@@ -152,7 +212,7 @@ async def test_stream_single_pattern_handles_malformed_json(monkeypatch, vault_e
     monkeypatch.setattr(
         vault_events_module,
         "connect",
-        lambda *args, **kwargs: _ConnectContextManager(websocket),
+        lambda *args, **kwargs: _PendingConnection(websocket),
     )
 
     with pytest.raises(asyncio.CancelledError):
@@ -162,7 +222,7 @@ async def test_stream_single_pattern_handles_malformed_json(monkeypatch, vault_e
             event_pattern="kv-v2/*",
             headers={"X-Vault-Token": "token"},
             ping_interval=20,
-            verify_ssl=True,
+            ssl_context=None,
             backoff_initial=1.0,
             backoff_max=30.0,
         )
@@ -174,18 +234,18 @@ async def test_stream_single_pattern_handles_malformed_json(monkeypatch, vault_e
 
 
 @pytest.mark.asyncio
-async def test_stream_single_pattern_retries_with_exponential_backoff(monkeypatch, vault_events_module):
+async def test_stream_single_pattern_retries_with_jittered_backoff(monkeypatch, vault_events_module):
     sleep_durations = []
 
     async def fake_sleep(duration):
         sleep_durations.append(duration)
-        if len(sleep_durations) >= 2:
+        if len(sleep_durations) >= 20:
             raise asyncio.CancelledError()
 
     monkeypatch.setattr(
         vault_events_module,
         "connect",
-        lambda *args, **kwargs: _FailingConnectContextManager(),
+        lambda *args, **kwargs: _FailingConnection(),
     )
     monkeypatch.setattr(vault_events_module.asyncio, "sleep", fake_sleep)
 
@@ -196,9 +256,752 @@ async def test_stream_single_pattern_retries_with_exponential_backoff(monkeypatc
             event_pattern="kv-v2/*",
             headers={"X-Vault-Token": "token"},
             ping_interval=20,
-            verify_ssl=True,
+            ssl_context=None,
+            backoff_initial=1.0,
+            backoff_max=5.0,
+        )
+
+    assert 1.0 <= sleep_durations[0] <= 3.0
+    for previous, current in zip(sleep_durations, sleep_durations[1:]):
+        assert 1.0 <= current <= min(5.0, previous * 3)
+
+
+@pytest.mark.asyncio
+async def test_stream_single_pattern_jitters_first_retry_across_tasks(monkeypatch, vault_events_module):
+    first_sleeps = []
+
+    async def fake_sleep(duration):
+        first_sleeps.append(duration)
+        raise asyncio.CancelledError()
+
+    monkeypatch.setattr(
+        vault_events_module,
+        "connect",
+        lambda *args, **kwargs: _FailingConnection(),
+    )
+    monkeypatch.setattr(vault_events_module.asyncio, "sleep", fake_sleep)
+
+    for _ in range(5):
+        with pytest.raises(asyncio.CancelledError):
+            await vault_events_module._stream_single_pattern(
+                queue=asyncio.Queue(),
+                vault_addr="http://127.0.0.1:8200",
+                event_pattern="kv-v2/*",
+                headers={"X-Vault-Token": "token"},
+                ping_interval=20,
+                ssl_context=None,
+                backoff_initial=1.0,
+                backoff_max=30.0,
+            )
+
+    assert all(1.0 <= duration <= 3.0 for duration in first_sleeps)
+    assert len(set(first_sleeps)) > 1
+
+
+def test_json_loads_prefers_orjson_when_available(vault_events_module):
+    orjson = pytest.importorskip("orjson")
+
+    assert vault_events_module._json_loads is orjson.loads
+    with pytest.raises(json.JSONDecodeError):
+        vault_events_module._json_loads("not-json")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "message",
+    [{"data": {"event_type": "kv-v2/data-write"}}, {"event_type": "kv-v2/data-write", "event": {}}],
+    ids=["cloudevent", "top-level"],
+)
+async def test_stream_single_pattern_logs_event_type_at_debug(monkeypatch, caplog, vault_events_module, message):
+    queue = asyncio.Queue()
+    websocket = _FakeWebSocket([json.dumps(message)])
+
+    monkeypatch.setattr(
+        vault_events_module,
+        "connect",
+        lambda *args, **kwargs: _PendingConnection(websocket),
+    )
+
+    with caplog.at_level("DEBUG", logger="vault_events"):
+        with pytest.raises(asyncio.CancelledError):
+            await vault_events_module._stream_single_pattern(
+                queue=queue,
+                vault_addr="http://127.0.0.1:8200",
+                event_pattern="kv-v2/*",
+                headers={"X-Vault-Token": "token"},
+                ping_interval=20,
+                ssl_context=None,
+                backoff_initial=1.0,
+                backoff_max=30.0,
+            )
+
+    assert "Received Vault event from pattern 'kv-v2/*': kv-v2/data-write" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_iter_raw_messages_requests_bytes_and_stops_on_clean_close(vault_events_module):
+    from websockets.exceptions import ConnectionClosedOK
+
+    class _ClosingWebSocket:
+        def __init__(self):
+            self.decode_args = []
+
+        async def recv(self, decode=None):
+            self.decode_args.append(decode)
+            if len(self.decode_args) > 1:
+                raise ConnectionClosedOK(None, None)
+            return b'{"event_type": "kv-v2/data-write"}'
+
+    websocket = _ClosingWebSocket()
+    messages = [msg async for msg in vault_events_module._iter_raw_messages(websocket)]
+
+    assert messages == [b'{"event_type": "kv-v2/data-write"}']
+    assert websocket.decode_args == [False, False]
+
+
+def test_coalesce_patterns_builds_or_filter(vault_events_module):
+    pattern, filter_expression = vault_events_module._coalesce_patterns(["kv-v2/*", "database/creds-*"])
+
+    assert pattern == "*"
+    assert filter_expression == (
+        'event_type matches "^kv-v2/.*$" or event_type matches "^database/creds-.*$"'
+    )
+
+
+def test_coalesce_patterns_combines_user_filter(vault_events_module):
+    pattern, filter_expression = vault_events_module._coalesce_patterns(
+        ["kv-v2/*", "kv-v1/*"],
+        'event_type contains "write"',
+    )
+
+    assert pattern == "*"
+    assert filter_expression == (
+        '(event_type contains "write") and '
+        '(event_type matches "^kv-v2/.*$" or event_type matches "^kv-v1/.*$")'
+    )
+
+
+def test_coalesce_patterns_catch_all_keeps_user_filter(vault_events_module):
+    assert vault_events_module._coalesce_patterns(["kv-v2/*", "*"], 'event_type contains "write"') == (
+        "*",
+        'event_type contains "write"',
+    )
+
+
+def test_coalesce_patterns_rejects_unsupported_patterns(vault_events_module):
+    assert vault_events_module._coalesce_patterns(["kv-v2/*"]) is None
+    assert vault_events_module._coalesce_patterns(["kv-v2/*", 'bad"pattern']) is None
+    assert vault_events_module._coalesce_patterns(["kv-v2/*\n", "database/*"]) is None
+
+
+@pytest.mark.asyncio
+async def test_main_coalesces_event_paths_into_single_connection(monkeypatch, vault_events_module):
+    single_mock = AsyncMock()
+    multiple_mock = AsyncMock()
+    monkeypatch.setattr(vault_events_module, "_stream_single_pattern", single_mock)
+    monkeypatch.setattr(vault_events_module, "_stream_multiple_patterns", multiple_mock)
+
+    await vault_events_module.main(
+        asyncio.Queue(),
+        {
+            "vault_addr": "http://127.0.0.1:8200",
+            "vault_token": "my-token",
+            "event_paths": ["kv-v2/*", "database/*"],
+            "coalesce_patterns": True,
+        },
+    )
+
+    multiple_mock.assert_not_awaited()
+    single_mock.assert_awaited_once()
+    call = single_mock.await_args.kwargs
+    assert call["event_pattern"] == "*"
+    assert call["encoded_filter"] == quote('event_type matches "^kv-v2/.*$" or event_type matches "^database/.*$"')
+
+
+def test_build_ssl_context_skips_plain_http(vault_events_module):
+    assert vault_events_module._build_ssl_context("http://127.0.0.1:8200", verify_ssl=True) is None
+
+
+def test_build_ssl_context_disables_verification(vault_events_module):
+    import ssl
+
+    ssl_context = vault_events_module._build_ssl_context("https://vault.example.com:8200", verify_ssl=False)
+
+    assert ssl_context.check_hostname is False
+    assert ssl_context.verify_mode == ssl.CERT_NONE
+
+
+@pytest.mark.asyncio
+async def test_main_shares_ssl_context_across_patterns(monkeypatch, vault_events_module):
+    stream_mock = AsyncMock()
+    monkeypatch.setattr(vault_events_module, "_stream_multiple_patterns", stream_mock)
+
+    await vault_events_module.main(
+        asyncio.Queue(),
+        {
+            "vault_addr": "https://vault.example.com:8200",
+            "vault_token": "my-token",
+            "event_paths": ["kv-v2/*", "database/*"],
+        },
+    )
+
+    ssl_context = stream_mock.await_args.kwargs["ssl_context"]
+    assert ssl_context is not None
+    assert ssl_context.check_hostname is True
+
+
+@pytest.mark.asyncio
+async def test_stream_single_pattern_holds_semaphore_only_during_handshake(monkeypatch, vault_events_module):
+    queue = asyncio.Queue()
+    connect_semaphore = asyncio.Semaphore(1)
+    websocket = _FakeWebSocket([json.dumps({"event_type": "kv-v2/data-write"})])
+    locked_during_handshake = []
+
+    def fake_connect(*args, **kwargs):
+        locked_during_handshake.append(connect_semaphore.locked())
+        return _PendingConnection(websocket)
+
+    original_recv = websocket.recv
+
+    async def recv(decode=None):
+        assert not connect_semaphore.locked()
+        return await original_recv(decode)
+
+    websocket.recv = recv
+    monkeypatch.setattr(vault_events_module, "connect", fake_connect)
+
+    with pytest.raises(asyncio.CancelledError):
+        await vault_events_module._stream_single_pattern(
+            queue=queue,
+            vault_addr="http://127.0.0.1:8200",
+            event_pattern="kv-v2/*",
+            headers={"X-Vault-Token": "token"},
+            ping_interval=20,
+            ssl_context=None,
+            backoff_initial=1.0,
+            backoff_max=30.0,
+            connect_semaphore=connect_semaphore,
+        )
+
+    assert locked_during_handshake == [True]
+    assert queue.qsize() == 1
+
+
+@pytest.mark.asyncio
+async def test_main_rejects_invalid_max_concurrent_connects(vault_events_module):
+    with pytest.raises(ValueError, match="max_concurrent_connects must be at least 1"):
+        await vault_events_module.main(
+            asyncio.Queue(),
+            {"vault_addr": "http://127.0.0.1:8200", "vault_token": "token", "max_concurrent_connects": 0},
+        )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("on_full", "event_types", "expected_types"),
+    [
+        ("drop", ["kv-v2/data-write", "kv-v2/data-delete"], ["kv-v2/data-write"]),
+        ("coalesce", ["kv-v2/data-write", "kv-v2/data-write"], ["kv-v2/data-write"]),
+    ],
+)
+async def test_stream_single_pattern_discards_events_when_queue_full(
+    monkeypatch, vault_events_module, on_full, event_types, expected_types
+):
+    queue = asyncio.Queue(maxsize=1)
+    websocket = _FakeWebSocket([json.dumps({"data": {"event_type": event_type}}) for event_type in event_types])
+
+    monkeypatch.setattr(
+        vault_events_module,
+        "connect",
+        lambda *args, **kwargs: _PendingConnection(websocket),
+    )
+
+    with pytest.raises(asyncio.CancelledError):
+        await vault_events_module._stream_single_pattern(
+            queue=queue,
+            vault_addr="http://127.0.0.1:8200",
+            event_pattern="kv-v2/*",
+            headers={"X-Vault-Token": "token"},
+            ping_interval=20,
+            ssl_context=None,
+            backoff_initial=1.0,
+            backoff_max=30.0,
+            on_full=on_full,
+        )
+
+    assert [queue.get_nowait()["data"]["event_type"] for _ in range(queue.qsize())] == expected_types
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "events",
+    [
+        [
+            {"data": {"event_type": "kv-v2/data-write"}},
+            {"data": {"event_type": "database/creds-create"}},
+            {"data": {"event_type": "kv-v2/data-delete"}},
+        ],
+        [{"id": 1}, {"id": 2}, {"id": 3}],
+    ],
+    ids=["distinct-types", "missing-types"],
+)
+async def test_stream_single_pattern_coalesce_waits_for_non_repeated_events(monkeypatch, vault_events_module, events):
+    queue = asyncio.Queue(maxsize=1)
+    websocket = _FakeWebSocket([json.dumps(event) for event in events])
+
+    monkeypatch.setattr(
+        vault_events_module,
+        "connect",
+        lambda *args, **kwargs: _PendingConnection(websocket),
+    )
+
+    stream = asyncio.create_task(
+        vault_events_module._stream_single_pattern(
+            queue=queue,
+            vault_addr="http://127.0.0.1:8200",
+            event_pattern="*",
+            headers={"X-Vault-Token": "token"},
+            ping_interval=20,
+            ssl_context=None,
+            backoff_initial=1.0,
+            backoff_max=30.0,
+            on_full="coalesce",
+        )
+    )
+
+    received = [await asyncio.wait_for(queue.get(), timeout=1.0) for _ in range(len(events))]
+
+    with pytest.raises(asyncio.CancelledError):
+        await stream
+
+    assert received == events
+
+
+def test_event_type_prefers_cloudevent_data(vault_events_module):
+    assert vault_events_module._event_type({"data": {"event_type": "kv-v2/data-write"}}) == "kv-v2/data-write"
+    assert vault_events_module._event_type({"event_type": "kv-v2/data-delete"}) == "kv-v2/data-delete"
+    assert vault_events_module._event_type({"data": None, "error": "json_decode_failed"}) is None
+    assert vault_events_module._event_type([1, 2]) is None
+    assert vault_events_module._event_type("kv-v2/data-write") is None
+
+
+@pytest.mark.asyncio
+async def test_stream_single_pattern_forwards_non_object_json(monkeypatch, caplog, vault_events_module):
+    queue = asyncio.Queue(maxsize=1)
+    websocket = _FakeWebSocket(["[1, 2]", "3", '"text"'])
+
+    monkeypatch.setattr(
+        vault_events_module,
+        "connect",
+        lambda *args, **kwargs: _PendingConnection(websocket),
+    )
+
+    stream = asyncio.create_task(
+        vault_events_module._stream_single_pattern(
+            queue=queue,
+            vault_addr="http://127.0.0.1:8200",
+            event_pattern="*",
+            headers={"X-Vault-Token": "token"},
+            ping_interval=20,
+            ssl_context=None,
+            backoff_initial=1.0,
+            backoff_max=30.0,
+            on_full="coalesce",
+        )
+    )
+
+    with caplog.at_level("DEBUG", logger="vault_events"):
+        received = [await asyncio.wait_for(queue.get(), timeout=1.0) for _ in range(3)]
+        with pytest.raises(asyncio.CancelledError):
+            await stream
+
+    assert received == [[1, 2], 3, "text"]
+    assert "Received Vault event from pattern '*': unknown" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_stream_single_pattern_rate_limits_drop_warnings(monkeypatch, caplog, vault_events_module):
+    queue = asyncio.Queue(maxsize=1)
+    websocket = _FakeWebSocket([json.dumps({"id": index}) for index in range(10)])
+
+    monkeypatch.setattr(
+        vault_events_module,
+        "connect",
+        lambda *args, **kwargs: _PendingConnection(websocket),
+    )
+
+    with pytest.raises(asyncio.CancelledError):
+        await vault_events_module._stream_single_pattern(
+            queue=queue,
+            vault_addr="http://127.0.0.1:8200",
+            event_pattern="kv-v2/*",
+            headers={"X-Vault-Token": "token"},
+            ping_interval=20,
+            ssl_context=None,
+            backoff_initial=1.0,
+            backoff_max=30.0,
+            on_full="drop",
+        )
+
+    warnings = [record.getMessage() for record in caplog.records if "Event queue full" in record.getMessage()]
+    assert [warning.split("(")[1] for warning in warnings] == [
+        "1 dropped so far)",
+        "2 dropped so far)",
+        "4 dropped so far)",
+        "8 dropped so far)",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_main_rejects_unknown_on_full_policy(vault_events_module):
+    with pytest.raises(ValueError, match="on_full must be one of: block, drop, coalesce"):
+        await vault_events_module.main(
+            asyncio.Queue(),
+            {"vault_addr": "http://127.0.0.1:8200", "vault_token": "token", "on_full": "discard"},
+        )
+
+
+@pytest.mark.asyncio
+async def test_stream_multiple_patterns_cancels_all_streams(monkeypatch, vault_events_module):
+    started = []
+    cancelled = []
+
+    async def fake_stream(queue, vault_addr, pattern, *args):
+        started.append(pattern)
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append(pattern)
+            raise
+
+    monkeypatch.setattr(vault_events_module, "_stream_single_pattern", fake_stream)
+
+    task = asyncio.create_task(
+        vault_events_module._stream_multiple_patterns(
+            queue=asyncio.Queue(),
+            vault_addr="http://127.0.0.1:8200",
+            event_paths=["kv-v2/*", "database/*"],
+            headers={"X-Vault-Token": "token"},
+            ping_interval=20,
+            ssl_context=None,
+            backoff_initial=1.0,
+            backoff_max=30.0,
+        )
+    )
+    while len(started) < 2:
+        await asyncio.sleep(0)
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert sorted(cancelled) == ["database/*", "kv-v2/*"]
+
+
+@pytest.mark.asyncio
+async def test_stream_multiple_patterns_cancels_peers_when_one_stream_fails(monkeypatch, vault_events_module):
+    cancelled = []
+
+    async def fake_stream(queue, vault_addr, pattern, *args):
+        if pattern == "database/*":
+            raise RuntimeError("stream failed")
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append(pattern)
+            raise
+
+    monkeypatch.setattr(vault_events_module, "_stream_single_pattern", fake_stream)
+
+    with pytest.raises(ExceptionGroup):
+        await vault_events_module._stream_multiple_patterns(
+            queue=asyncio.Queue(),
+            vault_addr="http://127.0.0.1:8200",
+            event_paths=["kv-v2/*", "database/*"],
+            headers={"X-Vault-Token": "token"},
+            ping_interval=20,
+            ssl_context=None,
+            backoff_initial=1.0,
+            backoff_max=30.0,
+        )
+
+    assert cancelled == ["kv-v2/*"]
+
+
+@pytest.mark.asyncio
+async def test_stream_single_pattern_blocks_until_queue_has_space(monkeypatch, vault_events_module):
+    queue = asyncio.Queue(maxsize=1)
+    websocket = _FakeWebSocket([json.dumps({"event_type": "kv-v2/data-write", "id": index}) for index in range(3)])
+
+    monkeypatch.setattr(
+        vault_events_module,
+        "connect",
+        lambda *args, **kwargs: _PendingConnection(websocket),
+    )
+
+    stream = asyncio.create_task(
+        vault_events_module._stream_single_pattern(
+            queue=queue,
+            vault_addr="http://127.0.0.1:8200",
+            event_pattern="kv-v2/*",
+            headers={"X-Vault-Token": "token"},
+            ping_interval=20,
+            ssl_context=None,
+            backoff_initial=1.0,
+            backoff_max=30.0,
+        )
+    )
+
+    received = [(await asyncio.wait_for(queue.get(), timeout=1.0))["id"] for _ in range(3)]
+
+    with pytest.raises(asyncio.CancelledError):
+        await stream
+
+    assert received == [0, 1, 2]
+
+
+def _record_local_decodes(monkeypatch, vault_events_module):
+    local_decodes = []
+    decode_event = vault_events_module._decode_event
+
+    def recording_decode_event(msg, event_pattern, debug_enabled):
+        local_decodes.append(msg)
+        return decode_event(msg, event_pattern, debug_enabled)
+
+    monkeypatch.setattr(vault_events_module, "_decode_event", recording_decode_event)
+    return local_decodes
+
+
+@pytest.mark.asyncio
+async def test_decode_event_in_executor_parses_and_falls_back_on_error(monkeypatch, vault_events_module):
+    from concurrent.futures import ThreadPoolExecutor
+
+    local_decodes = _record_local_decodes(monkeypatch, vault_events_module)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        event = await vault_events_module._decode_event_in_executor(
+            executor, b'{"event_type": "kv-v2/data-write"}', "kv-v2/*", False
+        )
+        error_event = await vault_events_module._decode_event_in_executor(executor, b"not-json", "kv-v2/*", False)
+
+    assert event == {"event_type": "kv-v2/data-write"}
+    assert error_event["error"] == "json_decode_failed"
+    assert error_event["raw"] == "not-json"
+    assert local_decodes == [b"not-json"]
+
+
+@pytest.mark.asyncio
+async def test_stream_single_pattern_offloads_only_large_messages(monkeypatch, vault_events_module):
+    queue = asyncio.Queue()
+    large_event = {"event_type": "kv-v2/data-write", "padding": "x" * vault_events_module._PARSE_POOL_THRESHOLD}
+    websocket = _FakeWebSocket([json.dumps({"event_type": "kv-v2/data-delete"}), json.dumps(large_event)])
+    offloaded = []
+
+    async def fake_decode_in_executor(executor, msg, event_pattern, debug_enabled):
+        offloaded.append(len(msg))
+        return vault_events_module._decode_event(msg, event_pattern, debug_enabled)
+
+    monkeypatch.setattr(vault_events_module, "_decode_event_in_executor", fake_decode_in_executor)
+    monkeypatch.setattr(
+        vault_events_module,
+        "connect",
+        lambda *args, **kwargs: _PendingConnection(websocket),
+    )
+
+    with pytest.raises(asyncio.CancelledError):
+        await vault_events_module._stream_single_pattern(
+            queue=queue,
+            vault_addr="http://127.0.0.1:8200",
+            event_pattern="kv-v2/*",
+            headers={"X-Vault-Token": "token"},
+            ping_interval=20,
+            ssl_context=None,
+            backoff_initial=1.0,
+            backoff_max=30.0,
+            parse_executor=object(),
+        )
+
+    assert len(offloaded) == 1
+    assert offloaded[0] > vault_events_module._PARSE_POOL_THRESHOLD
+    assert [queue.get_nowait()["event_type"] for _ in range(queue.qsize())] == [
+        "kv-v2/data-delete",
+        "kv-v2/data-write",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_decode_event_in_parse_pool_round_trip(monkeypatch, vault_events_module):
+    local_decodes = _record_local_decodes(monkeypatch, vault_events_module)
+    payload = {"data": {"event_type": "kv-v2/data-write"}, "padding": "x" * 20000}
+    msg = json.dumps(payload).encode("utf-8")
+
+    parse_pool = vault_events_module._create_parse_pool()
+    try:
+        assert parse_pool._mp_context.get_start_method() == "forkserver"
+
+        loop = asyncio.get_running_loop()
+        worker_event = await loop.run_in_executor(parse_pool, vault_events_module._json_loads, msg)
+        event = await vault_events_module._decode_event_in_executor(parse_pool, msg, "kv-v2/*", False)
+        error_event = await vault_events_module._decode_event_in_executor(parse_pool, b"not-json", "kv-v2/*", False)
+    finally:
+        parse_pool.shutdown(wait=True)
+
+    assert worker_event == payload
+    assert event == payload
+    assert error_event["error"] == "json_decode_failed"
+    assert local_decodes == [b"not-json"]
+
+
+@pytest.mark.asyncio
+async def test_stream_single_pattern_stops_offloading_after_pool_breaks(monkeypatch, caplog, vault_events_module):
+    from concurrent.futures import Executor
+    from concurrent.futures.process import BrokenProcessPool
+
+    class _BrokenPool(Executor):
+        def __init__(self):
+            self.submitted = 0
+
+        def submit(self, fn, /, *args, **kwargs):
+            self.submitted += 1
+            raise BrokenProcessPool("worker died")
+
+    queue = asyncio.Queue()
+    padding = "x" * vault_events_module._PARSE_POOL_THRESHOLD
+    websocket = _FakeWebSocket([json.dumps({"id": index, "padding": padding}) for index in range(3)])
+    broken_pool = _BrokenPool()
+
+    monkeypatch.setattr(
+        vault_events_module,
+        "connect",
+        lambda *args, **kwargs: _PendingConnection(websocket),
+    )
+
+    with pytest.raises(asyncio.CancelledError):
+        await vault_events_module._stream_single_pattern(
+            queue=queue,
+            vault_addr="http://127.0.0.1:8200",
+            event_pattern="kv-v2/*",
+            headers={"X-Vault-Token": "token"},
+            ping_interval=20,
+            ssl_context=None,
+            backoff_initial=1.0,
+            backoff_max=30.0,
+            parse_executor=broken_pool,
+        )
+
+    assert broken_pool.submitted == 1
+    assert caplog.text.count("Parse pool is broken") == 1
+    assert [queue.get_nowait()["id"] for _ in range(queue.qsize())] == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_main_creates_and_shuts_down_parse_pool(monkeypatch, vault_events_module):
+    from concurrent.futures import ProcessPoolExecutor
+
+    stream_mock = AsyncMock()
+    monkeypatch.setattr(vault_events_module, "_stream_multiple_patterns", stream_mock)
+
+    await vault_events_module.main(
+        asyncio.Queue(),
+        {"vault_addr": "http://127.0.0.1:8200", "vault_token": "token", "parse_pool": True},
+    )
+
+    parse_executor = stream_mock.await_args.kwargs["parse_executor"]
+    assert isinstance(parse_executor, ProcessPoolExecutor)
+    with pytest.raises(RuntimeError):
+        parse_executor.submit(len, b"")
+
+
+@pytest.mark.asyncio
+async def test_stream_single_pattern_disables_compression_by_default(monkeypatch, vault_events_module):
+    connect_kwargs = []
+
+    def fake_connect(*args, **kwargs):
+        connect_kwargs.append(kwargs)
+        return _PendingConnection(_FakeWebSocket([]))
+
+    monkeypatch.setattr(vault_events_module, "connect", fake_connect)
+
+    with pytest.raises(asyncio.CancelledError):
+        await vault_events_module._stream_single_pattern(
+            queue=asyncio.Queue(),
+            vault_addr="http://127.0.0.1:8200",
+            event_pattern="kv-v2/*",
+            headers={"X-Vault-Token": "token"},
+            ping_interval=20,
+            ssl_context=None,
             backoff_initial=1.0,
             backoff_max=30.0,
         )
 
-    assert sleep_durations == [1.0, 2.0]
+    assert connect_kwargs[0]["compression"] is None
+    assert connect_kwargs[0]["max_size"] == 2**20
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_size", [0, None])
+async def test_main_passes_compression_and_max_size(monkeypatch, vault_events_module, max_size):
+    stream_mock = AsyncMock()
+    monkeypatch.setattr(vault_events_module, "_stream_multiple_patterns", stream_mock)
+
+    await vault_events_module.main(
+        asyncio.Queue(),
+        {"vault_addr": "http://127.0.0.1:8200", "vault_token": "token", "compression": True, "max_size": max_size},
+    )
+
+    call = stream_mock.await_args.kwargs
+    assert call["compression"] is True
+    assert call["max_size"] is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ping_interval", [0, None])
+async def test_main_disables_ping_interval(monkeypatch, vault_events_module, ping_interval):
+    stream_mock = AsyncMock()
+    monkeypatch.setattr(vault_events_module, "_stream_multiple_patterns", stream_mock)
+
+    await vault_events_module.main(
+        asyncio.Queue(),
+        {"vault_addr": "http://127.0.0.1:8200", "vault_token": "token", "ping_interval": ping_interval},
+    )
+
+    assert stream_mock.await_args.kwargs["ping_interval"] is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("ping_interval", "keepalive"), [(None, 1), (20, 0)])
+async def test_stream_single_pattern_enables_tcp_keepalive_without_pings(
+    monkeypatch, vault_events_module, ping_interval, keepalive
+):
+    class _Transport:
+        def __init__(self, sock):
+            self._sock = sock
+
+        def get_extra_info(self, name):
+            return self._sock if name == "socket" else None
+
+    websocket = _FakeWebSocket([])
+
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        websocket.transport = _Transport(sock)
+        monkeypatch.setattr(
+            vault_events_module,
+            "connect",
+            lambda *args, **kwargs: _PendingConnection(websocket),
+        )
+
+        with pytest.raises(asyncio.CancelledError):
+            await vault_events_module._stream_single_pattern(
+                queue=asyncio.Queue(),
+                vault_addr="http://127.0.0.1:8200",
+                event_pattern="kv-v2/*",
+                headers={"X-Vault-Token": "token"},
+                ping_interval=ping_interval,
+                ssl_context=None,
+                backoff_initial=1.0,
+                backoff_max=30.0,
+            )
+
+        assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE) == keepalive
+        if keepalive and hasattr(socket, "TCP_KEEPIDLE"):
+            assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE) == 30